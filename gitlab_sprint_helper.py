@@ -1,13 +1,170 @@
+import functools
 import gitlab
+import json
+import os
 import re
-from datetime import datetime
+import shelve
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from gitlab.v4.objects import GroupEpic
+
+try:
+    # Optional linear-time engine for the issue URL scan (pip install google-re2)
+    import re2 as _fast_re
+except ImportError:
+    _fast_re = re
+
+DEFAULT_METRICS_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "sprint_helper", "sprint_metrics"
+)
+# Bump whenever calculate_sprint_metrics changes what it returns
+_METRICS_CACHE_VERSION = 1
+_metrics_cache_lock = threading.Lock()
+
+_SPRINT_TITLE_RE = re.compile(r"Sprint \d+/\d+: .+")
+# Classifies an epic comment in one match: a bare "# Review" heading splits the
+# sprint, any other heading may mention a goal and/or a reflection (lookaheads,
+# so a heading mentioning both sets both groups).
+_SPRINT_SECTION_RE = re.compile(
+    r"^\s*(?:(?P<review>#\s*Review\s*$)"
+    r"|#+(?=(?P<reflection>\s*.*reflection)?)(?=(?P<goal>\s*.*goal)?))",
+    re.IGNORECASE,
+)
+# One aliased project field of the batched issue-state GraphQL query
+_ISSUE_STATES_FIELD = (
+    "p{index}: project(fullPath: {project_path}) "
+    "{{ issues(iids: {iids}, first: 100) {{ nodes {{ iid state }} }} }}"
+)
+_ISSUE_URL_RE = _fast_re.compile(
+    r"https://gitlab\.com/([\w-]+/[\w-]+/[\w-]+)/-/(?:issues|work_items)/(\d+)"
+)
+
+
+def _parse_gitlab_datetime(value):
+    """Parse a GitLab ISO-8601 timestamp such as 2024-01-31T12:00:00.000Z."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _persist_past_sprint_metrics(calculate_sprint_metrics):
+    """Keep metrics of finished sprints on disk, keyed by epic ID and last update.
+
+    Running and upcoming sprints are always recalculated, and so is everything
+    when the helper's metrics_cache_path is None. The epic's updated_at does not
+    change when its issues are closed or MRs are updated after the sprint ended,
+    so those metrics stay frozen at their first calculation after the end date.
+    """
+
+    @functools.wraps(calculate_sprint_metrics)
+    def wrapper(self, sprint):
+        cache_path = self.metrics_cache_path
+        if not cache_path or not sprint.end_date:
+            return calculate_sprint_metrics(self, sprint)
+        if sprint.end_date >= date.today().isoformat():
+            return calculate_sprint_metrics(self, sprint)
+
+        key = (
+            f"{_METRICS_CACHE_VERSION}:{self.group_id}:{sprint.id}:{sprint.updated_at}"
+        )
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with _metrics_cache_lock, shelve.open(cache_path) as cache:
+            if key in cache:
+                return cache[key]
+
+        metrics = calculate_sprint_metrics(self, sprint)
+        with _metrics_cache_lock, shelve.open(cache_path) as cache:
+            # Drop entries of this sprint from older versions or earlier updates
+            sprint_suffix = f":{self.group_id}:{sprint.id}:"
+            for stale_key in [k for k in cache.keys() if sprint_suffix in k]:
+                del cache[stale_key]
+            cache[key] = metrics
+        return metrics
+
+    return wrapper
+
+
+@dataclass
+class MergeRequestStats:
+    """Per-sprint MR totals behind the merge, review and collaboration metrics."""
+
+    mr_count: int = 0
+    merged_count: int = 0
+    total_time_to_merge: float = 0  # seconds
+    total_comments: int = 0
+    mrs_with_comments: int = 0
+    unique_contributors: set = field(default_factory=set)
+    contribution_counts: Counter = field(default_factory=Counter)
+
+    @property
+    def average_time_to_merge(self):
+        if not self.merged_count:
+            return 0
+        return self.total_time_to_merge / self.merged_count / 3600  # return in hours
+
+    @property
+    def average_discussions_per_mr(self):
+        if not self.mr_count:
+            return 0
+        return self.total_comments / self.mr_count
+
+    @property
+    def percent_without_discussions(self):
+        if not self.mr_count:
+            return 0
+        return (self.mr_count - self.mrs_with_comments) / self.mr_count * 100
+
+    @property
+    def average_participants_per_discussion(self):
+        # Avoid division by zero
+        if not self.mrs_with_comments:
+            return 0
+        return self.total_comments / self.mrs_with_comments
 
 
 class GitLabSprintHelper:
-    def __init__(self, private_token, group_id):
-        self.gl = gitlab.Gitlab(private_token=private_token)
+    def __init__(
+        self, private_token, group_id, metrics_cache_path=DEFAULT_METRICS_CACHE_PATH
+    ):
+        self._private_token = private_token
         self.group_id = group_id
-        self.group = self.gl.groups.get(group_id, lazy=True)
+        self.metrics_cache_path = metrics_cache_path
+        self._local = threading.local()
+        self._sprints = None
+        self._epic_comments_cache = {}
+        self._mr_comments_cache = {}
+        self._mr_comments_executor = None
+        self._mr_comments_executor_lock = threading.Lock()
+
+    def _thread_state(self):
+        """Return this thread's GitLab client, group handle and project handles.
+
+        python-gitlab clients share a requests session that is not guaranteed to
+        be thread-safe, so every worker thread gets its own client.
+        """
+        state = self._local
+        if not hasattr(state, "gl"):
+            state.gl = gitlab.Gitlab(private_token=self._private_token)
+            state.group = state.gl.groups.get(self.group_id, lazy=True)
+            state.project_cache = {}
+        return state
+
+    @property
+    def gl(self):
+        return self._thread_state().gl
+
+    @property
+    def group(self):
+        return self._thread_state().group
+
+    def _thread_epic(self, epic):
+        """Return a lazy handle of epic bound to this thread's client.
+
+        Epic notes are addressed by the epic's global ID rather than its IID,
+        which a lazy epics.get would leave unset.
+        """
+        return GroupEpic(self.group.epics, {"id": epic.id, "iid": epic.iid}, lazy=True)
 
     def find_sprint_epic_by_name(self, sprint_name: str):  # type: ignore
         epics = self.group.epics.list(all=True)
@@ -16,76 +173,139 @@ class GitLabSprintHelper:
                 return epic
 
     def list_all_sprints(self):
-        sprints = self.group.epics.list(all=True)
-        sprint_pattern = re.compile(r"Sprint \d+/\d+: .+")
-        filtered_sprints = [
-            sprint for sprint in sprints if sprint_pattern.match(sprint.title)
-        ]
-        return filtered_sprints
+        if self._sprints is None:
+            # Let GitLab drop non-sprint epics, the title pattern does the rest
+            sprints = self.group.epics.list(
+                search="Sprint", iterator=True, per_page=100
+            )
+            self._sprints = [
+                sprint for sprint in sprints if _SPRINT_TITLE_RE.match(sprint.title)
+            ]
+        return self._sprints
 
     def fetch_epic_comments(self, epic):
-        return epic.notes.list(all=True)
+        if epic.iid not in self._epic_comments_cache:
+            # Go through this thread's client, not the one the epic was listed with
+            thread_epic = self._thread_epic(epic)
+            self._epic_comments_cache[epic.iid] = thread_epic.notes.list(all=True)
+        return self._epic_comments_cache[epic.iid]
 
     def split_sprint_comments(self, comments):
-        sorted_comments = sorted(
-            comments,
-            key=lambda x: datetime.strptime(x.created_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
-        )
-        goal_pattern = re.compile(r"^\s*#+\s*.*goal", re.IGNORECASE)
-        review_splitter_pattern = re.compile(r"^\s*#\s*Review\s*$", re.IGNORECASE)
-        reflection_pattern = re.compile(r"^\s*#+\s*.*reflection", re.IGNORECASE)
-
+        # GitLab timestamps are fixed-width UTC, so they sort chronologically as text
+        sorted_comments = sorted(comments, key=lambda x: x.created_at)
         planning_comments, review_comments = [], []
         review_section_started = False
 
         for comment in sorted_comments:
-            if review_splitter_pattern.match(comment.body.strip()):
+            match = _SPRINT_SECTION_RE.match(comment.body.strip())
+            if not match:
+                continue
+
+            if match.group("review") is not None:
                 review_section_started = True
                 continue
 
-            if review_section_started and reflection_pattern.match(comment.body):
+            if review_section_started and match.group("reflection") is not None:
                 review_comments.append(comment)
-            elif goal_pattern.match(comment.body):
+            elif match.group("goal") is not None:
                 planning_comments.append(comment)
 
         return planning_comments, review_comments
 
     def fetch_created_mrs_in_sprint(self, sprint) -> list:
-        mrs = list(
-            self.group.mergerequests.list(
-                all=True,
-                created_after=sprint.start_date,
-                created_before=sprint.end_date,
-            )
+        return self.group.mergerequests.list(
+            get_all=True,
+            per_page=100,
+            created_after=sprint.start_date,
+            created_before=sprint.end_date,
         )
-        return mrs
 
     def fetch_active_mrs_in_sprint(self, sprint) -> list:
-        mrs = list(
-            self.group.mergerequests.list(
-                all=True,
-                updated_after=sprint.start_date,
-                updated_before=sprint.end_date,
+        return self.group.mergerequests.list(
+            get_all=True,
+            per_page=100,
+            updated_after=sprint.start_date,
+            updated_before=sprint.end_date,
+        )
+
+    def _count_mrs(self, **params):
+        """Count the group's MRs matching params without downloading them.
+
+        Requests a single one-item page and reads the total from its X-Total
+        header, falling back to listing the MRs when GitLab omits the header
+        (it does for more than 10,000 results).
+        """
+        response = self.gl.http_request(
+            "get",
+            f"/groups/{gitlab.utils.EncodedId(self.group_id)}/merge_requests",
+            query_data={**params, "per_page": 1},
+        )
+        total = response.headers.get("X-Total")
+        if total is None:
+            return len(
+                self.group.mergerequests.list(get_all=True, per_page=100, **params)
             )
+        return int(total)
+
+    def count_created_mrs_in_sprint(self, sprint, state="all"):
+        return self._count_mrs(
+            state=state,
+            created_after=sprint.start_date,
+            created_before=sprint.end_date,
         )
-        return mrs
 
-    def fetch_mr_comments(self, merge_request):
-        project = self.gl.projects.get(merge_request.project_id)
-        mr = project.mergerequests.get(merge_request.iid)
-        comments = []
+    def _get_project(self, project_id):
+        """Return a lazy project handle for an ID or full path, reusing earlier ones."""
+        project_cache = self._thread_state().project_cache
+        if project_id not in project_cache:
+            project_cache[project_id] = self.gl.projects.get(project_id, lazy=True)
+        return project_cache[project_id]
 
-        for discussion in mr.discussions.list(all=True):
-            for note in discussion.attributes["notes"]:
-                if not note["system"]:
-                    comments.append(note)
+    def fetch_mr_comments(self, merge_request):
+        cache_key = (merge_request.project_id, merge_request.iid)
+        if cache_key in self._mr_comments_cache:
+            return self._mr_comments_cache[cache_key]
+
+        project = self._get_project(merge_request.project_id)
+        mr = project.mergerequests.get(merge_request.iid, lazy=True)
+        comments = [
+            note
+            for discussion in mr.discussions.list(per_page=100, iterator=True)
+            for note in discussion.attributes["notes"]
+            if not note["system"]
+        ]
 
+        self._mr_comments_cache[cache_key] = comments
         return comments
 
+    def _get_mr_comments_executor(self):
+        """Return the helper's MR comment thread pool, creating it on first use.
+
+        The pool lives as long as the helper, so its worker threads keep their
+        clients, connections and project handles across sprints.
+        """
+        with self._mr_comments_executor_lock:
+            if self._mr_comments_executor is None:
+                self._mr_comments_executor = ThreadPoolExecutor(max_workers=16)
+            return self._mr_comments_executor
+
+    def _fetch_all_mr_comments(self, mrs):
+        """Fetch comments of all MRs concurrently, keyed by (project_id, iid)."""
+        executor = self._get_mr_comments_executor()
+        all_comments = executor.map(self.fetch_mr_comments, mrs)
+        return {
+            (mr.project_id, mr.iid): comments for mr, comments in zip(mrs, all_comments)
+        }
+
     def calculate_mr_rate(self, planning_comments, mrs_in_sprint):
+        return self._mr_rate_from_count(planning_comments, len(mrs_in_sprint))
+
+    def _mr_rate_from_count(self, planning_comments, mr_count):
+        # The rate is 0 either way, so don't collect authors for nothing
+        if not planning_comments or not mr_count:
+            return 0
         team_members = {comment.author["username"] for comment in planning_comments}
-        mr_rate = len(mrs_in_sprint) / len(team_members) if team_members else 0
-        return mr_rate
+        return mr_count / len(team_members)
 
     def calculate_mr_completion_rate(self, mrs_in_sprint):
         merged_mrs = [mr for mr in mrs_in_sprint if mr.state == "merged"]
@@ -93,74 +313,145 @@ class GitLabSprintHelper:
             return 0
         return len(merged_mrs) / len(mrs_in_sprint)
 
-    def calculate_average_time_to_merge(self, mrs_in_sprint):
-        total_time_to_merge = 0
-        merged_mrs = [mr for mr in mrs_in_sprint if mr.state == "merged"]
-        for mr in merged_mrs:
-            created_at = datetime.strptime(mr.created_at, "%Y-%m-%dT%H:%M:%S.%fZ")
-            merged_at = datetime.strptime(mr.merged_at, "%Y-%m-%dT%H:%M:%S.%fZ")
-            total_time_to_merge += (merged_at - created_at).total_seconds()
-
-        if not merged_mrs:
+    def _count_mr_completion_rate(self, sprint, new_mr_count):
+        if not new_mr_count:
             return 0
-        return total_time_to_merge / len(merged_mrs) / 3600  # return in hours
+        merged_mr_count = self.count_created_mrs_in_sprint(sprint, state="merged")
+        return merged_mr_count / new_mr_count
+
+    def _aggregate_mr_stats(self, mrs_in_sprint, mr_comments=None):
+        """Collect all MR-based statistics in a single pass over the MRs.
+
+        mr_comments maps (project_id, iid) to the MR's comments, as returned by
+        _fetch_all_mr_comments; MRs missing from it count as without comments.
+        """
+        mr_comments = mr_comments or {}
+        stats = MergeRequestStats(mr_count=len(mrs_in_sprint))
 
-    def calculate_code_review_efficiency(self, mrs_in_sprint):
-        total_discussions = 0
-        mr_with_discussions = 0
         for mr in mrs_in_sprint:
-            comments = self.fetch_mr_comments(mr)
+            stats.contribution_counts[mr.author["username"]] += 1
+
+            if mr.state == "merged":
+                created_at = _parse_gitlab_datetime(mr.created_at)
+                merged_at = _parse_gitlab_datetime(mr.merged_at)
+                stats.total_time_to_merge += (merged_at - created_at).total_seconds()
+                stats.merged_count += 1
+
+            comments = mr_comments.get((mr.project_id, mr.iid))
             if comments:
-                total_discussions += len(comments)
-                mr_with_discussions += 1
+                stats.total_comments += len(comments)
+                stats.mrs_with_comments += 1
+                stats.unique_contributors.update(
+                    comment["author"]["id"] for comment in comments
+                )
 
-        if not mrs_in_sprint:
-            return 0, 0
-        average_discussions_per_mr = total_discussions / len(mrs_in_sprint)
-        percentage_without_discussions = (
-            (len(mrs_in_sprint) - mr_with_discussions) / len(mrs_in_sprint)
-        ) * 100
-        return average_discussions_per_mr, percentage_without_discussions
+        return stats
+
+    def calculate_average_time_to_merge(self, mrs_in_sprint):
+        return self._aggregate_mr_stats(mrs_in_sprint).average_time_to_merge
+
+    def calculate_code_review_efficiency(self, mrs_in_sprint, mr_comments=None):
+        if mr_comments is None:
+            mr_comments = self._fetch_all_mr_comments(mrs_in_sprint)
+        stats = self._aggregate_mr_stats(mrs_in_sprint, mr_comments)
+        return stats.average_discussions_per_mr, stats.percent_without_discussions
 
     def _extract_issue_info_from_comments(self, comments):
-        """Extract project paths and issue IDs from comments."""
-        issue_info = []
-        issue_url_pattern = re.compile(
-            r"https://gitlab.com/([\w-]+/[\w-]+/[\w-]+/-/(issues|work_items)/(\d+))"
-        )
+        """Extract the distinct (project path, issue ID) pairs linked in comments."""
+        issue_info = set()
 
         for comment in comments:
-            matches = issue_url_pattern.findall(comment.body)
-            for full_match, _, issue_id in matches:
-                project_path = "/".join(full_match.split("/")[:-3])
-                issue_info.append((project_path, issue_id))
+            # Cheap substring check so link-free comments skip the regex
+            if "gitlab.com/" not in comment.body:
+                continue
+            # Each match is already a (project_path, issue_id) tuple
+            issue_info.update(_ISSUE_URL_RE.findall(comment.body))
 
         return issue_info
 
+    def _fetch_issue_states_graphql(self, issue_ids_by_project):
+        """Fetch the states of all given issues in a single GraphQL request.
+
+        Returns a dict mapping (project_path, issue_id) to the issue state, or None
+        if the GraphQL API is not available.
+        """
+        fields, project_paths = [], []
+        for project_path, issue_ids in issue_ids_by_project.items():
+            # Connections return at most 100 nodes, so split larger projects
+            for start in range(0, len(issue_ids), 100):
+                fields.append(
+                    _ISSUE_STATES_FIELD.format(
+                        index=len(project_paths),
+                        project_path=json.dumps(project_path),
+                        iids=json.dumps(issue_ids[start : start + 100]),
+                    )
+                )
+                project_paths.append(project_path)
+
+        try:
+            result = self.gl.http_post(
+                f"{self.gl.url}/api/graphql",
+                post_data={"query": "{ " + " ".join(fields) + " }"},
+            )
+        except gitlab.exceptions.GitlabError:
+            return None  # e.g. a self-hosted instance with GraphQL disabled
+        if not isinstance(result, dict) or "errors" in result or not result.get("data"):
+            return None
+
+        issue_states = {}
+        for index, project_path in enumerate(project_paths):
+            project = result["data"].get(f"p{index}")
+            if not project:
+                continue  # Project not visible with this token
+            for node in project["issues"]["nodes"]:
+                issue_states[(project_path, node["iid"])] = node["state"]
+        return issue_states
+
+    def _fetch_issue_states_rest(self, issue_ids_by_project):
+        issue_states = {}
+        for project_path, issue_ids in issue_ids_by_project.items():
+            project = self._get_project(project_path)
+            for issue_id in issue_ids:
+                issue = project.issues.get(issue_id)
+                issue_states[(project_path, issue_id)] = issue.state
+        return issue_states
+
     def calculate_planned_issue_completion_rate(self, planning_comments):
         issue_infos = self._extract_issue_info_from_comments(planning_comments)
-        completed_issues = 0
-
-        for project_path, issue_id in issue_infos:
-            # Adjust this part to fetch the project and issue using the GitLab API
-            project = self.gl.projects.get(project_path)
-            issue = project.issues.get(issue_id)
-            if issue.state in ["closed", "merged"]:
-                completed_issues += 1
-
         if not issue_infos:
             return 0  # Avoid division by zero if no issues were found
+
+        issue_ids_by_project = defaultdict(list)
+        for project_path, issue_id in issue_infos:
+            issue_ids_by_project[project_path].append(issue_id)
+
+        issue_states = self._fetch_issue_states_graphql(issue_ids_by_project)
+        if issue_states is None:
+            issue_states = self._fetch_issue_states_rest(issue_ids_by_project)
+        else:
+            # GraphQL skips invisible projects and work items that aren't issues,
+            # look those up through REST rather than counting them as open
+            missing_ids_by_project = defaultdict(list)
+            for project_path, issue_id in issue_infos - issue_states.keys():
+                missing_ids_by_project[project_path].append(issue_id)
+            if missing_ids_by_project:
+                issue_states.update(
+                    self._fetch_issue_states_rest(missing_ids_by_project)
+                )
+
+        completed_issues = sum(
+            1 for state in issue_states.values() if state in ["closed", "merged"]
+        )
         return completed_issues / len(issue_infos)
 
     def calculate_scope_change_rate(self, planning_comments, review_comments):
-        initial_planned_issue_info = set(
-            self._extract_issue_info_from_comments(planning_comments)
-        )
-        all_mentioned_issue_info = set(
-            self._extract_issue_info_from_comments(review_comments + planning_comments)
+        initial_planned_issue_info = self._extract_issue_info_from_comments(
+            planning_comments
         )
+        review_issue_info = self._extract_issue_info_from_comments(review_comments)
 
-        new_issues = all_mentioned_issue_info - initial_planned_issue_info
+        # Same as (review | planned) - planned, without rescanning the planning
+        new_issues = review_issue_info - initial_planned_issue_info
         if not initial_planned_issue_info:
             # Avoid division by zero and return 0 for both values if no initial issues
             return 0, 0
@@ -168,53 +459,31 @@ class GitLabSprintHelper:
         scope_change_rate = len(new_issues) / len(initial_planned_issue_info)
         return len(new_issues), scope_change_rate
 
-    def calculate_mr_collaboration_score(self, mrs_in_sprint):
-        unique_contributors = set()
-        total_participants = 0
-        total_discussions = 0
-
-        for mr in mrs_in_sprint:
-            comments = self.fetch_mr_comments(mr)
-            for comment in comments:
-                unique_contributors.add(comment["author"]["id"])
-                total_participants += 1
-            if comments:
-                total_discussions += 1
-
-        # Avoid division by zero
-        average_participants_per_discussion = (
-            (total_participants / total_discussions) if total_discussions else 0
+    def calculate_mr_collaboration_score(self, mrs_in_sprint, mr_comments=None):
+        if mr_comments is None:
+            mr_comments = self._fetch_all_mr_comments(mrs_in_sprint)
+        stats = self._aggregate_mr_stats(mrs_in_sprint, mr_comments)
+        return (
+            len(stats.unique_contributors),
+            stats.average_participants_per_discussion,
         )
 
-        return len(unique_contributors), average_participants_per_discussion
-
     def calculate_work_distribution(self, mrs_in_sprint):
-        contribution_counts = {}
-
-        for mr in mrs_in_sprint:
-            author_username = mr.author["username"]
-            if author_username in contribution_counts:
-                contribution_counts[author_username] += 1
-            else:
-                contribution_counts[author_username] = 1
-
-        return contribution_counts
+        return self._aggregate_mr_stats(mrs_in_sprint).contribution_counts
 
+    @_persist_past_sprint_metrics
     def calculate_sprint_metrics(self, sprint):
         comments = self.fetch_epic_comments(sprint)
         planning_comments, review_comments = self.split_sprint_comments(comments)
-        new_mrs = self.fetch_created_mrs_in_sprint(sprint)
+        # Only counts of the newly created MRs are needed, not the MRs themselves
+        new_mr_count = self.count_created_mrs_in_sprint(sprint)
         active_mrs = self.fetch_active_mrs_in_sprint(sprint)
+        active_mr_comments = self._fetch_all_mr_comments(active_mrs)
+        active_mr_stats = self._aggregate_mr_stats(active_mrs, active_mr_comments)
 
-        average_discussions, percent_without_discussions = (
-            self.calculate_code_review_efficiency(active_mrs)
-        )
         new_issues, scope_change_rate = self.calculate_scope_change_rate(
             planning_comments, review_comments
         )
-        unique_contributors, avg_participants = self.calculate_mr_collaboration_score(
-            active_mrs
-        )
 
         metrics = {
             # summary
@@ -223,24 +492,32 @@ class GitLabSprintHelper:
             "end_date": sprint.end_date,
             "total_planning_comments": len(planning_comments),
             "total_review_comments": len(review_comments),
-            "new_mrs_in_sprint": len(new_mrs),
+            "new_mrs_in_sprint": new_mr_count,
             "all_active_mrs_in_sprint": len(active_mrs),
             # metrics
-            "mr_rate": self.calculate_mr_rate(planning_comments, new_mrs),
-            "mr_completion_rate": self.calculate_mr_completion_rate(new_mrs),
-            "average_time_to_merge": self.calculate_average_time_to_merge(active_mrs),
-            "average_discussions_per_mr": average_discussions,
-            "percent_mrs_dwithout_iscussions": percent_without_discussions,
+            "mr_rate": self._mr_rate_from_count(planning_comments, new_mr_count),
+            "mr_completion_rate": self._count_mr_completion_rate(
+                sprint, new_mr_count
+            ),
+            "average_time_to_merge": active_mr_stats.average_time_to_merge,
+            "average_discussions_per_mr": active_mr_stats.average_discussions_per_mr,
+            "percent_mrs_dwithout_iscussions": (
+                active_mr_stats.percent_without_discussions
+            ),
             "planned_issue_completion_rate": self.calculate_planned_issue_completion_rate(
                 planning_comments
             ),
             "scope_change_new_issues": new_issues,
             "scope_change_rate": scope_change_rate,
             # collaboration and work distribution
-            "collaboration_score_unique_contributors": unique_contributors,
-            "collaboration_score_avg_participants": avg_participants,
+            "collaboration_score_unique_contributors": len(
+                active_mr_stats.unique_contributors
+            ),
+            "collaboration_score_avg_participants": (
+                active_mr_stats.average_participants_per_discussion
+            ),
             # work distribution
-            "work_distribution": self.calculate_work_distribution(active_mrs),
+            "work_distribution": active_mr_stats.contribution_counts,
         }
 
         return metrics
@@ -255,6 +532,20 @@ class GitLabSprintHelper:
 
         return all_sprint_metrics
 
+    def get_metrics_for_all_sprints_concurrent(self, max_workers=4):
+        """Like get_metrics_for_all_sprints, but processes sprints in parallel.
+
+        Keep max_workers low: every sprint fans out its own MR comment requests.
+        """
+
+        def calculate(sprint):
+            print(f"Calculating metrics for {sprint.title}")
+            return self.calculate_sprint_metrics(sprint)
+
+        sprints = self.list_all_sprints()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(calculate, sprints))
+
     def get_mr_rate_for_all_sprints(self):
         all_sprint_mr_rates = []
         sprints = self.list_all_sprints()
@@ -262,8 +553,8 @@ class GitLabSprintHelper:
             print(f"Calculating metrics for {sprint.title}")
             comments = self.fetch_epic_comments(sprint)
             planning_comments, _ = self.split_sprint_comments(comments)
-            new_mrs = self.fetch_created_mrs_in_sprint(sprint)
-            mr_rate = self.calculate_mr_rate(planning_comments, new_mrs)
+            new_mr_count = self.count_created_mrs_in_sprint(sprint)
+            mr_rate = self._mr_rate_from_count(planning_comments, new_mr_count)
             all_sprint_mr_rates.append(
                 {
                     "sprint_name": sprint.title,
@@ -1,14 +1,15 @@
+import pandas as pd
 import streamlit as st
 from gitlab_sprint_helper import GitLabSprintHelper
 
 
-# Function to fetch MR rate data
+# Function to fetch MR rate data, cached so widget reruns don't hit GitLab again
+@st.cache_data(ttl=600, show_spinner="Fetching data...")
 def fetch_data():
-    with st.spinner("Fetching data..."):
-        helper = GitLabSprintHelper(
-            st.secrets["gitlab"]["private_token"], st.secrets["gitlab"]["group_id"]
-        )
-        data = helper.get_mr_rate_for_all_sprints()
+    helper = GitLabSprintHelper(
+        st.secrets["gitlab"]["private_token"], st.secrets["gitlab"]["group_id"]
+    )
+    data = helper.get_mr_rate_for_all_sprints()
     return data
 
 
@@ -23,4 +24,4 @@ dates = [sprint["start_date"] for sprint in data]
 mr_rates = [sprint["mr_rate"] for sprint in data]
 
 # Plotting the MR rate over time
-st.line_chart({date: rate for date, rate in zip(dates, mr_rates)})
+st.line_chart(pd.DataFrame({"mr_rate": mr_rates}, index=pd.to_datetime(dates)))